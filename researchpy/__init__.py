@@ -18,63 +18,68 @@ Key Features:
 Last updated: 03/05/2024
 """
 
+import importlib
+import sys
+import types
+
 from .version import __version__, __author__, __email__, __license__
 
-# Core statistical functions
-from .ttest import ttest
-from .difference_test import difference_test
-
-# Summary statistics
-from .summary import summary_cont, summary_cat, codebook, summarize
-
-# Correlation analysis
-from .correlation import corr_case, corr_pair
-
-# Crosstabulation and chi-square
-from .crosstab import crosstab
-
-# Visualization functions
-from .visualization import (
-    plot_ttest,
-    plot_correlation,
-    plot_anova,
-    plot_crosstab,
-)
-
-# Basic statistical functions
-from .basic_stats import (
-    count,
-    nanvar,
-    nanstd,
-    nansem,
-    value_range,
-    kurtosis,
-    skew,
-    confidence_interval,
-    l_ci,
-    u_ci,
-)
-
-# Utility functions
-from .utility import variable_information, base_table
-
-# Advanced statistical modeling
-from .model import model
-from .anova import anova
-from .ols import ols
-
-# Non-parametric tests
-from .signrank import signrank
-
-# Model utilities and prediction
-from .predict import (
-    predict,
-    predict_y,
-    residuals,
-    standardized_residuals,
-    studentized_residuals,
-    leverage,
-)
+# The public API is imported lazily (PEP 562): each name below is resolved
+# from its submodule on first access, so "import researchpy" does not pull in
+# scipy, statsmodels, matplotlib or seaborn until they are needed.
+_LAZY = {
+    # Core statistical functions
+    "ttest": ".ttest",
+    "difference_test": ".difference_test",
+    # Summary statistics
+    "summary_cont": ".summary",
+    "summary_cat": ".summary",
+    "codebook": ".summary",
+    "summarize": ".summary",
+    # Correlation analysis
+    "corr_case": ".correlation",
+    "corr_pair": ".correlation",
+    # Crosstabulation and chi-square
+    "crosstab": ".crosstab",
+    # Visualization functions
+    "plot_ttest": ".visualization",
+    "plot_correlation": ".visualization",
+    "plot_anova": ".visualization",
+    "plot_crosstab": ".visualization",
+    # Basic statistical functions
+    "count": ".basic_stats",
+    "nanvar": ".basic_stats",
+    "nanstd": ".basic_stats",
+    "nansem": ".basic_stats",
+    "value_range": ".basic_stats",
+    "kurtosis": ".basic_stats",
+    "skew": ".basic_stats",
+    "confidence_interval": ".basic_stats",
+    "confidence_interval_batch": ".basic_stats",
+    "l_ci": ".basic_stats",
+    "u_ci": ".basic_stats",
+    "make_ci_fn": ".basic_stats",
+    # Utility functions
+    "variable_information": ".utility",
+    "base_table": ".utility",
+    # Advanced statistical modeling
+    "model": ".model",
+    "anova": ".anova",
+    "ols": ".ols",
+    # Non-parametric tests
+    "signrank": ".signrank",
+    # Model utilities and prediction
+    "predict": ".predict",
+    "predict_y": ".predict",
+    "residuals": ".predict",
+    "standardized_residuals": ".predict",
+    "studentized_residuals": ".predict",
+    "leverage": ".predict",
+}
+
+# Submodules whose names do not collide with a public function or class;
+# these resolve to the submodule itself, imported on first access
+_SUBMODULES = ("basic_stats", "summary", "correlation", "utility", "visualization")
 
 # Define what gets imported with "from researchpy import *"
 __all__ = [
@@ -110,8 +115,10 @@ __all__ = [
     "kurtosis",
     "skew",
     "confidence_interval",
+    "confidence_interval_batch",
     "l_ci",
     "u_ci",
+    "make_ci_fn",
     # Utility functions
     "variable_information",
     "base_table",
@@ -129,3 +136,31 @@ __all__ = [
     "studentized_residuals",
     "leverage",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        attr = getattr(module, name)
+        globals()[name] = attr
+        return attr
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it on the package, which would shadow the
+        # function of the same name (e.g. researchpy.ttest); those names keep
+        # resolving through __getattr__ instead
+        if name in _LAZY and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
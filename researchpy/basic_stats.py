@@ -5,11 +5,254 @@ This module provides fundamental statistical functions that properly handle
 missing (NaN) values, serving as building blocks for other researchpy functions.
 """
 
+import importlib.util
+from functools import lru_cache
 from typing import Union, List, Tuple
 import numpy
 import numpy as np
+import scipy.special
 import scipy.stats
 
+# numba is optional; without it the NumPy implementations below are used. It
+# is only imported once a kernel is first needed, as importing it is costly.
+_HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+# LLVM's "nnan"/"ninf" fast-math flags would allow the NaN checks to be folded
+# away, so only the flags that are safe for NaN-aware kernels are enabled.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def _as_vector(d):
+    """
+    Return ``d`` as a contiguous 1-D float64 array, or None when ``d`` is not
+    one dimensional (e.g. a patsy DesignMatrix), in which case callers fall
+    back to the NumPy implementation.
+    """
+    arr = numpy.asarray(d)
+    if arr.ndim != 1:
+        return None
+    return numpy.ascontiguousarray(arr, dtype=numpy.float64)
+
+
+class _Moments:
+    """
+    Moments of the non-missing values of a 1-D array, computed by one kernel
+    call so that several statistics of the same data share a single scan.
+
+    ``n`` is the number of non-missing values, ``m1`` their mean and ``m2``,
+    ``m3``, ``m4`` the sums of the 2nd, 3rd and 4th powers of the deviations
+    from the mean. The basic statistics functions accept an instance in place
+    of the data.
+    """
+
+    __slots__ = ("n", "m1", "m2", "m3", "m4")
+
+    def __init__(self, n, m1, m2, m3, m4):
+        self.n = n
+        self.m1 = m1
+        self.m2 = m2
+        self.m3 = m3
+        self.m4 = m4
+
+
+# NumPy implementations, used without numba and for arrays below
+# _JIT_MIN_SIZE. Data without missing values is used in place rather than
+# copied through a mask.
+
+
+def _basic_stats_numpy(d):
+    mask = d == d
+    n = numpy.count_nonzero(mask)
+    if n == 0:
+        return 0, numpy.nan, 0.0
+    valid = d if n == d.shape[0] else d[mask]
+    mean = valid.mean()
+    dev = valid - mean
+    return n, float(mean), float(numpy.dot(dev, dev))
+
+
+def _moments_numpy(d):
+    mask = d == d
+    n = numpy.count_nonzero(mask)
+    if n == 0:
+        return 0, numpy.nan, 0.0, 0.0, 0.0
+    valid = d if n == d.shape[0] else d[mask]
+    mean = valid.mean()
+    dev = valid - mean
+    dev2 = dev * dev
+    return (n, float(mean), float(dev2.sum()), float(numpy.dot(dev2, dev)),
+            float(numpy.dot(dev2, dev2)))
+
+
+def _count_nonnan_numpy(d):
+    return numpy.count_nonzero(d == d)
+
+
+def _nanminmax_numpy(d):
+    # fmin/fmax skip NaN, returning it only when every value is missing
+    if d.shape[0] == 0:
+        return numpy.nan, numpy.nan
+    return numpy.fmin.reduce(d), numpy.fmax.reduce(d)
+
+
+# Kernels compiled with numba on first use by _dispatch. They mask missing
+# values with x == x predication instead of branching, and take a sum pass
+# followed by a pass over the deviations from the mean. Unlike Welford's
+# update, which divides by n on every element, both loops carry no serial
+# dependency and LLVM vectorizes them. The second pass also sums the
+# deviations, whose mean is the rounding error of the first pass' mean, and
+# the sums are shifted onto the corrected mean (the corrected two-pass
+# algorithm); otherwise data with a large mean and a small spread loses
+# digits in the odd moments.
+
+
+def _basic_stats_loop(d):
+    # Returns the number of non-missing values, their mean, and the sum
+    # of squared deviations.
+    n = 0
+    total = 0.0
+    for i in range(d.shape[0]):
+        x = d[i]
+        valid = x == x
+        n += valid
+        total += x if valid else 0.0
+    if n == 0:
+        return 0, np.nan, 0.0
+
+    mean = total / n
+    s1 = 0.0
+    m2 = 0.0
+    for i in range(d.shape[0]):
+        x = d[i]
+        dev = x - mean if x == x else 0.0
+        s1 += dev
+        m2 += dev * dev
+    c = s1 / n
+    return n, mean + c, m2 - s1 * c
+
+
+def _moments_loop(d):
+    # As _basic_stats_loop, extended to the 3rd and 4th central moments.
+    n = 0
+    total = 0.0
+    for i in range(d.shape[0]):
+        x = d[i]
+        valid = x == x
+        n += valid
+        total += x if valid else 0.0
+    if n == 0:
+        return 0, np.nan, 0.0, 0.0, 0.0
+
+    mean = total / n
+    s1 = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for i in range(d.shape[0]):
+        x = d[i]
+        dev = x - mean if x == x else 0.0
+        dev2 = dev * dev
+        s1 += dev
+        m2 += dev2
+        m3 += dev2 * dev
+        m4 += dev2 * dev2
+    c = s1 / n
+    c2 = c * c
+    return (n, mean + c, m2 - s1 * c,
+            m3 - 3 * c * m2 + 2 * n * c2 * c,
+            m4 - 4 * c * m3 + 6 * c2 * m2 - 3 * n * c2 * c2)
+
+
+def _count_nonnan_loop(d):
+    # NaN is the only value for which x == x is False; no fast-math flags
+    # so the comparison cannot be optimized away.
+    n = 0
+    for i in range(d.shape[0]):
+        x = d[i]
+        if x == x:
+            n += 1
+    return n
+
+
+def _nanminmax_loop(d):
+    # Minimum and maximum of the non-missing values in one sweep
+    found = False
+    mn = np.inf
+    mx = -np.inf
+    for i in range(d.shape[0]):
+        x = d[i]
+        if x == x:
+            found = True
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+    if not found:
+        return np.nan, np.nan
+    return mn, mx
+
+
+# Arrays shorter than this use the NumPy implementations. The first call of a
+# numba kernel in a process costs a few hundred milliseconds, to import numba
+# and compile the kernel or load it from the on-disk cache, which only pays
+# off on large arrays; short scripts on typical research data never start the
+# JIT at all.
+_JIT_MIN_SIZE = 100_000
+
+
+def _dispatch(kernel, fallback, **options):
+    """
+    Combine a numba kernel with its NumPy fallback, choosing by array length.
+    The kernel is compiled (with cache=True) the first time it is needed.
+    """
+    if not _HAVE_NUMBA:
+        return fallback
+
+    jitted = None
+
+    def dispatch(d):
+        nonlocal jitted
+        if d.shape[0] < _JIT_MIN_SIZE:
+            return fallback(d)
+        if jitted is None:
+            import numba
+
+            jitted = numba.njit(cache=True, **options)(kernel)
+        return jitted(d)
+
+    return dispatch
+
+
+_basic_stats_kernel = _dispatch(_basic_stats_loop, _basic_stats_numpy,
+                                fastmath=_FASTMATH)
+_moments_kernel = _dispatch(_moments_loop, _moments_numpy, fastmath=_FASTMATH)
+_count_nonnan_f64 = _dispatch(_count_nonnan_loop, _count_nonnan_numpy)
+_nanminmax = _dispatch(_nanminmax_loop, _nanminmax_numpy)
+
+
+def _moments(d):
+    """
+    Return the _Moments of ``d``, or None when ``d`` is not one dimensional.
+    """
+    arr = _as_vector(d)
+    if arr is None:
+        return None
+    return _Moments(*_moments_kernel(arr))
+
+
+def _second_moments(d):
+    """
+    Return ``(n, mean, m2)`` of ``d``, reusing ``d`` itself when it is already a
+    _Moments, or None when ``d`` is not one dimensional.
+    """
+    if isinstance(d, _Moments):
+        return d.n, d.m1, d.m2
+    arr = _as_vector(d)
+    if arr is None:
+        return None
+    return _basic_stats_kernel(arr)
+
 
 def count(d: Union[numpy.ndarray, List]) -> int:
     """
@@ -32,7 +275,18 @@ def count(d: Union[numpy.ndarray, List]) -> int:
     >>> count(data)
     4
     """
-    return numpy.count_nonzero(~numpy.isnan(d))
+    if isinstance(d, _Moments):
+        return d.n
+    arr = numpy.asarray(d)
+    if arr.dtype.kind in "iub":
+        # Integer, unsigned and boolean data cannot hold NaN
+        return arr.size
+    if arr.dtype == numpy.float64 and arr.ndim == 1 and arr.flags.c_contiguous:
+        return _count_nonnan_f64(arr)
+    vec = _as_vector(arr)
+    if vec is None:
+        return numpy.count_nonzero(~numpy.isnan(arr))
+    return _count_nonnan_f64(vec)
 
 
 def nanvar(d):
@@ -46,10 +300,14 @@ def nanvar(d):
     Returns
     -------
     Float
-        The variance of the non-missing data passed; calculated as numpy.nanvar(d, ddof = 1).
+        The variance of the non-missing data passed; equivalent to numpy.nanvar(d, ddof = 1).
 
     """
-    return numpy.nanvar(d, ddof=1)
+    stats = _second_moments(d)
+    if stats is None:
+        return numpy.nanvar(d, ddof=1)
+    n, _, m2 = stats
+    return m2 / (n - 1) if n > 1 else numpy.nan
 
 
 def nanstd(d):
@@ -63,10 +321,14 @@ def nanstd(d):
     Returns
     -------
     Float
-        The standard deviation of the non-missing data passed; calculated as numpy.nanstd(d, ddof = 1).
+        The standard deviation of the non-missing data passed; equivalent to numpy.nanstd(d, ddof = 1).
 
     """
-    return numpy.nanstd(d, ddof=1)
+    stats = _second_moments(d)
+    if stats is None:
+        return numpy.nanstd(d, ddof=1)
+    n, _, m2 = stats
+    return numpy.sqrt(m2 / (n - 1)) if n > 1 else numpy.nan
 
 
 def nansem(d):
@@ -80,10 +342,14 @@ def nansem(d):
     Returns
     -------
     Float
-        The standard error of the non-missing data passed; calculated as scipy.stats.sem(d, nan_policy= 'omit').
+        The standard error of the non-missing data passed; equivalent to scipy.stats.sem(d, nan_policy= 'omit').
 
     """
-    return scipy.stats.sem(d, nan_policy='omit')
+    stats = _second_moments(d)
+    if stats is None:
+        return scipy.stats.sem(d, nan_policy='omit')
+    n, _, m2 = stats
+    return numpy.sqrt(m2 / (n - 1) / n) if n > 1 else numpy.nan
 
 
 def value_range(d):
@@ -97,15 +363,26 @@ def value_range(d):
     Returns
     -------
     Float
-        The range of the data passed; calculated as numpy.nanmax(d) - numpy.nanmin(d).
+        The range of the data passed; equivalent to numpy.nanmax(d) - numpy.nanmin(d).
 
     """
-    min_val = numpy.nanmin(d)
-    max_val = numpy.nanmax(d)
+    arr = _as_vector(d)
+    if arr is None:
+        return float(numpy.nanmax(d) - numpy.nanmin(d))
+
+    min_val, max_val = _nanminmax(arr)
 
     return float(max_val - min_val)
 
 
+def _degenerate(m):
+    """
+    True when the higher moments of ``m`` are undefined: no data, or a variance
+    indistinguishable from zero (the same cut-off scipy.stats uses).
+    """
+    return m.n == 0 or m.m2 / m.n <= (numpy.finfo(numpy.float64).resolution * m.m1) ** 2
+
+
 def kurtosis(d):
     """
 
@@ -117,10 +394,15 @@ def kurtosis(d):
     Returns
     -------
     Float
-        The kurtosis of the distribution of the data passed using Pearson's definition; calculated as scipy.stats.kurtosis(d, fisher = False, nan_policy = 'omit').'
+        The kurtosis of the distribution of the data passed using Pearson's definition; equivalent to scipy.stats.kurtosis(d, fisher = False, nan_policy = 'omit').'
 
     """
-    return float(scipy.stats.kurtosis(d, fisher=False, nan_policy='omit'))
+    m = d if isinstance(d, _Moments) else _moments(d)
+    if m is None:
+        return float(scipy.stats.kurtosis(d, fisher=False, nan_policy='omit'))
+    if _degenerate(m):
+        return numpy.nan
+    return float(m.n * m.m4 / m.m2 ** 2)
 
 
 def skew(d):
@@ -134,10 +416,83 @@ def skew(d):
     Returns
     -------
     Float
-        The skew of the distribution of the data passed; calculated as scipy.stats.skew(d, nan_policy = 'omit').
+        The skew of the distribution of the data passed; equivalent to scipy.stats.skew(d, nan_policy = 'omit').
+
+    """
+    m = d if isinstance(d, _Moments) else _moments(d)
+    if m is None:
+        return float(scipy.stats.skew(d, nan_policy='omit'))
+    if _degenerate(m):
+        return numpy.nan
+    return float(numpy.sqrt(m.n) * m.m3 / m.m2 ** 1.5)
+
+
+@lru_cache(maxsize=1024)
+def _t_q(alpha, n):
+    """
+    Two-sided critical value of Student's t for confidence level ``alpha``
+    with ``n`` degrees of freedom; memoized since summary tables reuse it.
+    """
+    return scipy.special.stdtrit(n, (1 + alpha) / 2)
+
+
+def make_ci_fn(alpha, df):
+    """
+
+    Parameters
+    ----------
+    alpha : decimal (float)
+        Confidence interval range to be calculated, e.g. 0.95.
+
+    df : numeric
+        The degrees of freedom, i.e. the number of observations - 1.
+
+    Returns
+    -------
+    Function
+        A function taking (mean, se) and returning the (lower, upper) bounds of the confidence
+        interval. The critical t value is computed once, so applying the returned function to
+        many rows sharing the same alpha and degrees of freedom only costs two multiplications each.
+
+    """
+    q = _t_q(alpha, df)
+
+    def ci(mean, se):
+        return mean - q * se, mean + q * se
+
+    return ci
 
+
+def _ci_limits(n, mean, se, alpha):
+    """
+    Lower and upper confidence limits from the number of observations, the
+    mean and the standard error; works elementwise on arrays, Series and
+    DataFrames alike.
     """
-    return float(scipy.stats.skew(d, nan_policy='omit'))
+    q = scipy.special.stdtrit(n - 1, (1 + alpha) / 2) * se
+
+    return mean - q, mean + q
+
+
+def _ci_parameters(d, n, loc, scale):
+    """
+    Fill in the degrees of freedom, center (mean) and scale (standard error)
+    of a confidence interval that were not supplied, from a single kernel
+    call over ``d``.
+    """
+    if n is not None and loc is not None and scale is not None:
+        return n, loc, scale
+
+    stats = _second_moments(d)
+    if stats is None:
+        nobs, mean, se = count(d), numpy.nanmean(d), nansem(d)
+    else:
+        nobs, mean, m2 = stats
+        se = numpy.sqrt(m2 / (nobs - 1) / nobs) if nobs > 1 else numpy.nan
+
+    return (nobs - 1 if n is None else n,
+            mean if loc is None else loc,
+            se if scale is None else scale)
 
 
 def confidence_interval(d, alpha=0.95, n=None, loc=None, scale=None, decimals=4):
@@ -170,22 +525,40 @@ def confidence_interval(d, alpha=0.95, n=None, loc=None, scale=None, decimals=4)
 
     """
 
-    if n is None:
-        n = count(d) - 1
-    central = numpy.nanmean(d) if loc is None else loc
-    scaler = nansem(d) if scale is None else scale
+    n, central, scaler = _ci_parameters(d, n, loc, scale)
+
+    q = _t_q(alpha, n) * scaler
 
-    ci_intervals = list(scipy.stats.t.interval(alpha,
-                                               n,
-                                               loc=central,
-                                               scale=scaler))
+    return [round(central - q, decimals), round(central + q, decimals)]
 
-    idx = 0
-    for value in ci_intervals:
-        ci_intervals[idx] = round(value, decimals)
-        idx += 1
 
-    return ci_intervals
+def confidence_interval_batch(D, alpha=0.95, axis=0):
+    """
+
+    Parameters
+    ----------
+    D : array_like
+        The data being passed to the function; a 2-D array with one variable per column (or row, see axis).
+
+    alpha : decimal (float), optional
+        Confidence interval range to be calculated. The default is 0.95.
+
+    axis : integer, optional
+        The axis along which the observations lie. The default is 0, i.e. one confidence interval per column.
+
+    Returns
+    -------
+    lower, upper : numpy.ndarray
+        The lower and upper bounds of the confidence interval of each variable, computed in one
+        vectorized pass; missing data is ignored.
+
+    """
+    D = numpy.asarray(D, dtype=numpy.float64)
+
+    n = (~numpy.isnan(D)).sum(axis)
+    mean = numpy.nanmean(D, axis)
+    se = numpy.sqrt(numpy.nanvar(D, axis, ddof=1) / n)
+    return _ci_limits(n, mean, se, alpha)
 
 
 def l_ci(d, alpha=0.95, n=None, loc=None, scale=None, decimals=4):
@@ -218,16 +591,9 @@ def l_ci(d, alpha=0.95, n=None, loc=None, scale=None, decimals=4):
 
     """
 
-    if n is None:
-        n = count(d) - 1
-    central = numpy.nanmean(d) if loc is None else loc
-    scaler = nansem(d) if scale is None else scale
+    n, central, scaler = _ci_parameters(d, n, loc, scale)
 
-    l_ci, _ = scipy.stats.t.interval(alpha,
-                                     n,
-                                     loc=central,
-                                     scale=scaler)
-    return round(l_ci, decimals)
+    return round(central - _t_q(alpha, n) * scaler, decimals)
 
 
 def u_ci(d, alpha=0.95, n=None, loc=None, scale=None, decimals=4):
@@ -260,13 +626,6 @@ def u_ci(d, alpha=0.95, n=None, loc=None, scale=None, decimals=4):
 
     """
 
-    if n is None:
-        n = count(d) - 1
-    central = numpy.nanmean(d) if loc is None else loc
-    scaler = nansem(d) if scale is None else scale
+    n, central, scaler = _ci_parameters(d, n, loc, scale)
 
-    _, u_ci = scipy.stats.t.interval(alpha,
-                                     n,
-                                     loc=central,
-                                     scale=scaler)
-    return round(u_ci, decimals)
+    return round(central + _t_q(alpha, n) * scaler, decimals)
@@ -7,23 +7,77 @@ Created on Mon Aug  6 12:18:47 2018
 
 import pandas
 import numpy
+import scipy.special
 import scipy.stats
 import itertools
 
 
-def corr_case(dataframe, method="pearson"):
+def _pearson_r(X):
+    """
+    Pearson's r for every pair of columns of the 2-D array ``X``, which must
+    not contain missing data, computed with one matrix product.
+    """
+    n = X.shape[0]
+    if n < 2:
+        raise ValueError("x and y must have length at least 2.")
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        Xn = (X - X.mean(axis=0)) / X.std(axis=0, ddof=1)
+        r = numpy.clip(Xn.T @ Xn / (n - 1), -1, 1)
+
+    # Rounding leaves the diagonal a hair below 1; sign() makes it exact
+    # while keeping NaN for constant columns
+    diagonal = numpy.diag_indices_from(r)
+    r[diagonal] = numpy.sign(r[diagonal])
+
+    return r
+
+
+def _pearson_matrix(df):
+    """
+    Pearson's r and the two-sided p-values for every pair of columns of ``df``,
+    which must not contain missing data, instead of one scipy.stats.pearsonr
+    call per pair.
+    """
+    X = df.to_numpy(dtype=float)
+    n = X.shape[0]
+    r = _pearson_r(X)
+
+    if n == 2:
+        # Two points always lie on a line; as scipy.stats.pearsonr, p is 1
+        p = numpy.where(numpy.isnan(r), numpy.nan, 1.0)
+    else:
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            t = r * numpy.sqrt((n - 2) / (1 - r**2))
+        p = 2 * scipy.special.stdtr(n - 2, -numpy.abs(t))
+
+    return (pandas.DataFrame(r, index=df.columns, columns=df.columns),
+            pandas.DataFrame(p, index=df.columns, columns=df.columns))
+
+
+def _corr_r(dataframe, method="pearson"):
+    """
+    The rounded r matrix of corr_case(), without its p-values; used for
+    plotting. Pearson's r skips the p-values entirely, while the Spearman and
+    Kendall tests compute them as part of the statistic anyway.
+    """
+    if method not in (None, "pearson"):
+        return corr_case(dataframe, method=method)[1]
 
     df = dataframe.dropna(how="any")._get_numeric_data()
-    dfcols = pandas.DataFrame(columns=df.columns)
+    r = _pearson_r(df.to_numpy(dtype=float))
+
+    return pandas.DataFrame(r, index=df.columns, columns=df.columns).round(4)
+
 
-    # Getting r an p value dataframes ready
-    r_vals = dfcols.transpose().join(dfcols, how="outer")
-    p_vals = dfcols.transpose().join(dfcols, how="outer")
+def corr_case(dataframe, method="pearson"):
+
+    df = dataframe.dropna(how="any")._get_numeric_data()
     length = str(len(df))
 
     # Setting test
     if method in (None, "pearson"):
-        test = scipy.stats.pearsonr
+        test = None
         test_name = "Pearson"
 
     elif method == "spearman":
@@ -38,13 +92,27 @@ def corr_case(dataframe, method="pearson"):
         raise ValueError("Unknown method: " + method)
 
     # Rounding values for the r and p value dataframes
-    for r in df.columns:
-        for c in df.columns:
-            r_vals.loc[r, c] = round(test(df[r], df[c])[0], 4)
+    if test is None:
+        r_matrix, p_matrix = _pearson_matrix(df)
+        r_vals = r_matrix.round(4)
+        p_vals = pandas.DataFrame(
+            [[format(p, ".4f") for p in row] for row in p_matrix.to_numpy()],
+            index=p_matrix.index,
+            columns=p_matrix.columns,
+        )
 
-    for r in df.columns:
-        for c in df.columns:
-            p_vals.loc[r, c] = format(test(df[r], df[c])[1], ".4f")
+    else:
+        # Getting the p value dataframe ready
+        dfcols = pandas.DataFrame(columns=df.columns)
+        p_vals = dfcols.transpose().join(dfcols, how="outer")
+
+        r_matrix = pandas.DataFrame(numpy.nan, index=df.columns, columns=df.columns)
+        for r in df.columns:
+            for c in df.columns:
+                stat, pval = test(df[r], df[c])[:2]
+                r_matrix.loc[r, c] = stat
+                p_vals.loc[r, c] = format(pval, ".4f")
+        r_vals = r_matrix.round(4)
 
     # Getting the testing information dataframe ready
     info = pandas.DataFrame(
@@ -3,6 +3,7 @@ import scipy.stats
 import patsy
 import pandas
 
+from .basic_stats import nansem
 from .summary import summarize
 from .model import model
 from .utility import *
@@ -221,7 +222,7 @@ class difference_test(object):
 
             difference = group1 - group2
 
-            se = float(scipy.stats.sem(difference, nan_policy= 'omit'))
+            se = float(nansem(difference))
 
             ci_lower_diff, ci_upper_diff = scipy.stats.t.interval(self.parameters["Conf. Level"],
                                                                   dof,
@@ -21,113 +21,53 @@ import pandas
 import numpy
 import scipy.stats
 from .basic_stats import *
+from .basic_stats import _moments, _ci_limits
 
-## summary_cont() provides descriptive statistics for continuous data
-
-def summary_cont(group1, conf = 0.95, decimals = 4):
-
+## Builds the summary_cont() table for every column of a 2-D array in one
+##  vectorized pass instead of one DataFrame (and scipy call) per variable
 
+def _summary_cont_table(names, data, conf):
 
     conf_level = f"{round(conf * 100)}%"
 
-    if type(group1) == pandas.core.series.Series:
-
-        #### PUTTING THE INFORMATION INTO A DATAFRAME #####
-        table = pandas.DataFrame(numpy.zeros(shape= (1,7)),
-                         columns = ['Variable', 'N', 'Mean', 'SD', 'SE', f'{conf_level} Conf.', 'Interval'])
-
-
-        # Setting up the first column (Variable names)
-        table.iloc[0,0] = group1.name
-
-        # Setting up the second column (Number of observations)
-        table.iloc[0,1] = group1.count()
-
-        # Setting up the third column (Mean)
-        table.iloc[0,2] = numpy.mean(group1)
-
-        # Setting up the fourth column (Standard Deviation (SD))
-        table.iloc[0,3] = numpy.std(group1, ddof= 1)
-
-        # Setting up the fith column (Standard Error (SE))
-        table.iloc[0,4] = scipy.stats.sem(group1, nan_policy= 'omit')
-
-        # Setting up the sixth and seventh column (95% CI)
-        table.iloc[0,5], table.iloc[0,6] = scipy.stats.t.interval(conf,
-                                          group1.count() - 1,
-                                          loc= numpy.mean(group1), scale= scipy.stats.sem(group1, nan_policy= 'omit'))
-
-    elif type(group1) == pandas.core.frame.DataFrame:
-
-        table = pandas.DataFrame(numpy.zeros(shape= (1,7)),
-                         columns = ['Variable', 'N', 'Mean', 'SD', 'SE',
-                                    f'{conf_level} Conf.', 'Interval'])
-
-        count = 0
-
-        for ix, df_col in group1.items():
-
-            count = count + 1
-
-            if count == 0:
-
-                table = pandas.DataFrame(numpy.zeros(shape= (1,7)),
-                         columns = ['Variable', 'N', 'Mean', 'SD', 'SE',
-                                    f'{conf_level} Conf.', 'Interval'])
+    n = (~numpy.isnan(data)).sum(axis= 0)
+    mean = numpy.nanmean(data, axis= 0)
+    sd = numpy.nanstd(data, axis= 0, ddof= 1)
+    se = sd / numpy.sqrt(n)
 
-                # Setting up the first column (Variable names)
-                table.iloc[0,0] = ix
+    # The CI limits from the N, mean and SE above, without another scan
+    lower, upper = _ci_limits(n, mean, se, conf)
 
-                # Setting up the second column (Number of observations)
-                table.iloc[0,1] = df_col.count()
+    table = pandas.DataFrame({'Variable': names,
+                              'N': n,
+                              'Mean': mean,
+                              'SD': sd,
+                              'SE': se,
+                              f'{conf_level} Conf.': lower,
+                              'Interval': upper})
 
-                # Setting up the third column (Mean)
-                table.iloc[0,2] = numpy.mean(df_col)
-
-                # Setting up the fourth column (Standard Deviation (SD))
-                table.iloc[0,3] = numpy.std(df_col, ddof= 1)
-
-                # Setting up the fith column (Standard Error (SE))
-                table.iloc[0,4] = scipy.stats.sem(df_col, nan_policy= 'omit')
-
-                # Setting up the sixth and seventh column (95% CI)
-                table.iloc[0,5], table.iloc[0,6] = scipy.stats.t.interval(conf,
-                                          df_col.count() - 1,
-                                          loc= numpy.mean(df_col),
-                                          scale= scipy.stats.sem(df_col, nan_policy= 'omit'))
-            else:
-
-                table_a = pandas.DataFrame(numpy.zeros(shape= (1,7)),
-                         columns = ['Variable', 'N', 'Mean', 'SD', 'SE',
-                                    f'{conf_level} Conf.', 'Interval'])
+    return table
 
-                # Setting up the first column (Variable names)
-                table_a.iloc[0,0] = ix
 
-                # Setting up the second column (Number of observations)
-                table_a.iloc[0,1] = df_col.count()
+## summary_cont() provides descriptive statistics for continuous data
 
-                # Setting up the third column (Mean)
-                table_a.iloc[0,2] = numpy.mean(df_col)
+def summary_cont(group1, conf = 0.95, decimals = 4):
 
-                # Setting up the fourth column (Standard Deviation (SD))
-                table_a.iloc[0,3] = numpy.std(df_col, ddof= 1)
 
-                # Setting up the fith column (Standard Error (SE))
-                table_a.iloc[0,4] = scipy.stats.sem(df_col, nan_policy= 'omit')
 
-                # Setting up the sixth and seventh column (95% CI)
-                table_a.iloc[0,5], table_a.iloc[0,6] = scipy.stats.t.interval(conf,
-                                          df_col.count() - 1,
-                                          loc= numpy.mean(df_col),
-                                          scale= scipy.stats.sem(df_col, nan_policy= 'omit'))
+    conf_level = f"{round(conf * 100)}%"
 
+    if type(group1) == pandas.core.series.Series:
 
+        table = _summary_cont_table([group1.name],
+                                    group1.to_numpy(dtype= float, na_value= numpy.nan)[:, None],
+                                    conf)
 
-            table = pandas.concat([table, table_a], ignore_index= "true")
+    elif type(group1) == pandas.core.frame.DataFrame:
 
-        table.drop(0, inplace= True)
-        table.reset_index(inplace= True, drop= True)
+        table = _summary_cont_table(group1.columns.tolist(),
+                                    group1.to_numpy(dtype= float, na_value= numpy.nan),
+                                    conf)
 
 
 
@@ -144,45 +84,26 @@ def summary_cont(group1, conf = 0.95, decimals = 4):
         se.rename("SE", inplace= True)
 
         # 95% CI
-        l_ci, u_ci = scipy.stats.t.interval(conf,
-                                          cnt - 1,
-                                          loc= group1.mean(),
-                                          scale= group1.sem())
+        l_ci, u_ci = _ci_limits(cnt, mean, se, conf)
 
         table = pandas.concat([cnt, mean, std, se,
-                               pandas.Series(l_ci, index = cnt.index),
-                               pandas.Series(u_ci, index = cnt.index)],
+                               l_ci.rename(f'{conf_level} Conf.'),
+                               u_ci.rename("Interval")],
                               axis= 'columns')
 
-        table.rename(columns = {'count': 'N', 'mean': 'Mean', 'std': 'SD',
-                                'sem': 'SE', 0 : f'{conf_level} Conf.', 1 : "Interval" },
-                                inplace= True)
-
 
     elif type(group1) == pandas.core.groupby.DataFrameGroupBy :
 
-        # There has to be a better way to get the lower and upper CI limits
-        # in the groupby table. Until then, this works :/
-        def l_ci(x):
-            l_ci, _ = scipy.stats.t.interval(conf,
-                                                x.count() - 1,
-                                                loc= x.mean(),
-                                                scale= x.sem())
-
-
-            return l_ci
-
-        def u_ci(x):
-            _, u_ci = scipy.stats.t.interval(conf,
-                                                x.count() - 1,
-                                                loc= x.mean(),
-                                                scale= x.sem())
-
-
-            return u_ci
+        table = group1.agg(['count', 'mean', 'std', 'sem'])
 
-        table = group1.agg(['count', numpy.mean, numpy.std,
-                            pandas.DataFrame.sem, l_ci, u_ci])
+        # Both CI limits of every variable at once from the aggregated N,
+        # mean and SE, placed after each variable's SE
+        l_ci, u_ci = _ci_limits(table.xs('count', axis= 'columns', level= 1),
+                                table.xs('mean', axis= 'columns', level= 1),
+                                table.xs('sem', axis= 'columns', level= 1),
+                                conf)
+        ci = pandas.concat({'l_ci': l_ci, 'u_ci': u_ci}, axis= 'columns').swaplevel(axis= 'columns')
+        table = pandas.concat([table, ci], axis= 'columns')[table.columns.get_level_values(0).unique()]
 
         table.rename(columns = {'count': 'N', 'mean': 'Mean', 'std': 'SD',
                                 'sem': 'SE', "l_ci" : f'{conf_level} Conf.', "u_ci" : "Interval"}, inplace= True)
@@ -559,12 +480,16 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
 
         results["Name"] = data.columns.tolist()
 
+        # One pass per column shared by all of the moment based statistics
+        if {"N", "Variance", "SD", "SE", "CI", "Kurtosis", "Skew"}.intersection(stats):
+            moments = data.apply(_moments)
+
         idx = -1
         for test in stats:
             idx += 1
 
             if "N" == test:
-                results[test] = round(data.apply(count), decimals)
+                results[test] = round(moments.apply(count), decimals)
 
             if "Mean" == test:
                 results[test] = round(data.apply(numpy.nanmean), decimals)
@@ -573,16 +498,16 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
                 results[test] = round(data.apply(numpy.nanmedian), decimals)
 
             if "Variance" == test:
-                results[test] = round(data.apply(nanvar), decimals)
+                results[test] = round(moments.apply(nanvar), decimals)
 
             if "SD" == test:
-                results[test] = round(data.apply(nanstd), decimals)
+                results[test] = round(moments.apply(nanstd), decimals)
 
             if "SE" == test:
-                results[test] = round(data.apply(nansem), decimals)
+                results[test] = round(moments.apply(nansem), decimals)
 
             if "CI" == test:
-                results[f"{int(ci_level * 100)}% Conf. Interval"] = data.apply(lambda x: confidence_interval(x, alpha = ci_level, decimals = decimals))
+                results[f"{int(ci_level * 100)}% Conf. Interval"] = moments.apply(lambda x: confidence_interval(x, alpha = ci_level, decimals = decimals))
                 stats[idx] = f"{int(ci_level * 100)}% Conf. Interval"
 
             if "Min" == test:
@@ -595,10 +520,10 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
                 results[test] = round(data.apply(value_range), decimals)
 
             if "Kurtosis" == test:
-                results[test] = round(data.apply(kurtosis), decimals)
+                results[test] = round(moments.apply(kurtosis), decimals)
 
             if "Skew" == test:
-                results[test] = round(data.apply(skew), decimals)
+                results[test] = round(moments.apply(skew), decimals)
 
 
 
@@ -606,9 +531,19 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
 
     else:
 
+        # One pass shared by the moment based statistics; data that is not one
+        # dimensional (e.g. patsy DesignMatrix objects) is used as is
+        try:
+            moments = _moments(data)
+        except (TypeError, ValueError):
+            moments = None
+
+        if moments is None:
+            moments = data
+
         if "N" in stats:
             try:
-                results["N"] = count(data)
+                results["N"] = count(moments)
             except:
                 results["N"] = data.apply(lambda x: numpy.count_nonzero(~x.apply(numpy.isnan)))
 
@@ -630,7 +565,7 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
 
         if "Variance" in stats:
             try:
-                results["Variance"] = round(nanvar(data), decimals)
+                results["Variance"] = round(nanvar(moments), decimals)
             except:
                 try:
                     results["Variance"] = data.apply(lambda x: round(nanvar(x), decimals))
@@ -640,7 +575,7 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
 
         if "SD" in stats:
             try:
-                results["SD"] = round(nanstd(data), decimals)
+                results["SD"] = round(nanstd(moments), decimals)
             except:
                 try:
                     results["SD"] = data.apply(lambda x: round(nanstd(x), decimals))
@@ -650,7 +585,7 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
 
         if "SE" in stats:
             try:
-                results["SE"] = round(nansem(data), decimals)
+                results["SE"] = round(nansem(moments), decimals)
             except:
                 try:
                     results["SE"] = data.apply(lambda x: nansem(x))
@@ -660,12 +595,8 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
 
         if "CI" in stats:
             try:
-                ci_lower, ci_upper = scipy.stats.t.interval(ci_level,
-                                                            count(data) - 1,
-                                                            loc = numpy.nanmean(data),
-                                                            scale = nansem(data))
-
-                results[f"{int(ci_level * 100)}% Conf. Interval"] = [round(ci_lower, decimals), round(ci_upper, decimals)]
+                # Both limits from the shared moments
+                results[f"{int(ci_level * 100)}% Conf. Interval"] = confidence_interval(moments, alpha = ci_level, decimals = decimals)
             except:
                 try:
                     # Used on patsy.design_info.DesignMatrix objects
@@ -682,13 +613,8 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
                                                                                         loc = numpy.nanmean(x),
                                                                                         scale = nansem(x))))
 
-                        ci_intervals = ci_intervals.to_dict()
-                        for lst in ci_intervals.values():
-                            idx = 0
-                            for value in lst:
-                                lst[idx] = round(value, decimals)
-                                idx += 1
-
+                        ci_intervals = {key: [round(lower, decimals), round(upper, decimals)]
+                                        for key, (lower, upper) in ci_intervals.to_dict().items()}
 
                         results[f"{int(ci_level * 100)}% Conf. Interval"] = ci_intervals
 
@@ -720,7 +646,7 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
 
         if "Range" in stats:
             try:
-                results["Range"] = round(numpy.nanmax(data) - numpy.nanmin(data), decimals)
+                results["Range"] = round(value_range(data), decimals)
             except:
                 try:
                     results["Range"] = round(data.apply(lambda x: numpy.nanmax(x) - numpy.nanmin(x)), decimals)
@@ -731,7 +657,7 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
         if "Kurtosis" in stats:
             # This computes kurtosis using Pearson's definition
             try:
-                results["Kurtosis"] = round(kurtosis(data), decimals)
+                results["Kurtosis"] = round(kurtosis(moments), decimals)
             except:
                 try:
                     results["Kurtosis"] = round(data.apply(lambda x: kurtosis(x)), decimals)
@@ -742,7 +668,7 @@ def summarize(data = {}, name = None, stats = [], ci_level = 0.95, decimals = 4,
 
         if "Skew" in stats:
             try:
-                results["Skew"] = round(skew(data), decimals)
+                results["Skew"] = round(skew(moments), decimals)
             except:
                 try:
                     results["Skew"] = round(data.apply(lambda x: skew(x)), decimals)
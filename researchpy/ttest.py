@@ -11,6 +11,8 @@ import pandas
 import numpy
 import scipy.stats
 
+from .basic_stats import nansem, _t_q
+
 
 # -*- coding: utf-8 -*-
 """
@@ -422,35 +424,27 @@ def ttest(group1, group2, group1_name= None, group2_name= None,
 
 
     # Setting up the fith column (Standard Error (SE))
-    table.iloc[0,4] = scipy.stats.sem(group1, nan_policy= 'omit')
-    table.iloc[1,4] = scipy.stats.sem(group2, nan_policy= 'omit')
+    table.iloc[0,4] = nansem(group1)
+    table.iloc[1,4] = nansem(group2)
 
     if test == "Paired samples t-test":
-        table.iloc[2,4] = scipy.stats.sem(diff, nan_policy= 'omit')
+        table.iloc[2,4] = nansem(diff)
     else:
-        table.iloc[2,4] = scipy.stats.sem(groups, nan_policy= 'omit')
+        table.iloc[2,4] = nansem(groups)
 
 
     # Setting up the sixth and seventh column (95% CI)
-    table.iloc[0,5], table.iloc[0,6] = scipy.stats.t.interval(0.95,
-                                          group1.count() - 1,
-                                          loc= numpy.mean(group1),
-                                          scale= scipy.stats.sem(group1, nan_policy= 'omit'))
-    table.iloc[1,5], table.iloc[1,6] = scipy.stats.t.interval(0.95,
-                                          group2.count() - 1,
-                                          loc= numpy.mean(group2),
-                                          scale= scipy.stats.sem(group2, nan_policy= 'omit'))
+    q = _t_q(0.95, group1.count() - 1) * table.iloc[0,4]
+    table.iloc[0,5], table.iloc[0,6] = table.iloc[0,2] - q, table.iloc[0,2] + q
+
+    q = _t_q(0.95, group2.count() - 1) * table.iloc[1,4]
+    table.iloc[1,5], table.iloc[1,6] = table.iloc[1,2] - q, table.iloc[1,2] + q
 
     if test == "Paired samples t-test":
-        table.iloc[2,5], table.iloc[2,6] = scipy.stats.t.interval(0.95,
-                                          diff.count() - 1,
-                                          loc= numpy.mean(diff),
-                                          scale= scipy.stats.sem(diff, nan_policy= 'omit'))
+        q = _t_q(0.95, diff.count() - 1) * table.iloc[2,4]
     else:
-        table.iloc[2,5], table.iloc[2,6] = scipy.stats.t.interval(0.95,
-                                          groups.count() - 1,
-                                          loc= numpy.mean(groups),
-                                          scale= scipy.stats.sem(groups, nan_policy= 'omit'))
+        q = _t_q(0.95, groups.count() - 1) * table.iloc[2,4]
+    table.iloc[2,5], table.iloc[2,6] = table.iloc[2,2] - q, table.iloc[2,2] + q
 
 
     if equal_variances == False and paired == True:
@@ -1,47 +1,91 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
 from .ttest import ttest
-from .correlation import corr_case
+from .correlation import _corr_r
 from .anova import anova
 from .crosstab import crosstab
 
-sns.set_theme(style="whitegrid", palette="muted")
+# matplotlib and seaborn are imported inside the plotting functions, and the
+# theme applied on the first plot, so importing researchpy stays cheap
+_THEME_SET = False
 
 
-def plot_ttest(group1, group2, paired=False, equal_variances=True, palette="muted"):
-    """Visualize distributions for a t-test."""
-    _desc, _results = ttest(
-        group1,
-        group2,
-        paired=paired,
-        equal_variances=equal_variances,
-    )
+def _ensure_theme():
+    """Apply the researchpy seaborn theme once, on first use."""
+    global _THEME_SET
+    if not _THEME_SET:
+        import seaborn as sns
+
+        sns.set_theme(style="whitegrid", palette="muted")
+        _THEME_SET = True
+
+
+def plot_ttest(
+    group1,
+    group2,
+    paired=False,
+    equal_variances=True,
+    palette="muted",
+    show_stats=False,
+):
+    """Visualize distributions for a t-test.
+
+    With ``show_stats=True`` the t-test is also run and its descriptive and
+    result tables are attached to the returned axes as ``ax._rp_desc`` and
+    ``ax._rp_results``.
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
 
-    data = pd.DataFrame(
-        {
-            "value": pd.concat([group1, group2]),
-            "group": [group1.name] * len(group1) + [group2.name] * len(group2),
-        }
+    _ensure_theme()
+    values = np.concatenate([np.asarray(group1), np.asarray(group2)])
+    groups = np.repeat(
+        np.array([group1.name, group2.name], dtype=object),
+        [len(group1), len(group2)],
     )
+    data = pd.DataFrame({"value": values, "group": groups})
     plt.figure()
     ax = sns.boxplot(x="group", y="value", data=data, palette=palette)
     sns.stripplot(x="group", y="value", data=data, color="black", alpha=0.5, ax=ax)
     ax.set_title("T-Test" if not paired else "Paired T-Test")
+
+    if show_stats:
+        ax._rp_desc, ax._rp_results = ttest(
+            group1,
+            group2,
+            paired=paired,
+            equal_variances=equal_variances,
+        )
     return ax
 
 
 def plot_correlation(dataframe, method="pearson", annot=True, cmap="coolwarm"):
     """Plot correlation matrix heatmap."""
-    _info, r_vals, _ = corr_case(dataframe, method=method)
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    _ensure_theme()
+    r_vals = _corr_r(dataframe, method=method)
     plt.figure()
-    ax = sns.heatmap(r_vals.astype(float), annot=annot, cmap=cmap, vmin=-1, vmax=1)
+    ax = sns.heatmap(
+        r_vals.values,
+        xticklabels=r_vals.columns,
+        yticklabels=r_vals.index,
+        annot=annot,
+        cmap=cmap,
+        vmin=-1,
+        vmax=1,
+    )
     ax.set_title(f"{method.capitalize()} Correlation Matrix")
     return ax
 
 
 def plot_anova(formula, data, palette="muted"):
     """Visualize group means for ANOVA."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    _ensure_theme()
     analysis = anova(formula, data)
     dv = formula.split("~")[0].strip()
     iv = formula.split("~")[1].strip()
@@ -53,6 +97,10 @@ def plot_anova(formula, data, palette="muted"):
 
 def plot_crosstab(group1, group2, palette="crest"):
     """Plot heatmap for crosstab counts."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    _ensure_theme()
     table = crosstab(group1, group2)
     plt.figure()
     ax = sns.heatmap(table, annot=True, fmt="d", cmap=palette)
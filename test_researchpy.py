@@ -2,324 +2,478 @@
 """
 Comprehensive test suite for ResearchPy library.
 
-This script tests all major functions and features of the ResearchPy library
-to ensure functionality works correctly and produces expected outputs.
+These tests exercise all major functions and features of the ResearchPy
+library to ensure functionality works correctly and produces expected outputs.
+The random test data is generated once per session and shared between tests.
+
+Run with ``pytest test_researchpy.py``.
 """
 
+import importlib
+import inspect
+import os
+import subprocess
 import sys
-import warnings
-import traceback
-import pandas as pd
+
 import numpy as np
+import pandas as pd
+import pytest
+import scipy.stats
+
+import researchpy as rp
 
 # Suppress warnings for cleaner test output
-warnings.filterwarnings("ignore", category=FutureWarning)
-warnings.filterwarnings("ignore", category=UserWarning)
+pytestmark = [
+    pytest.mark.filterwarnings("ignore::FutureWarning"),
+    pytest.mark.filterwarnings("ignore::UserWarning"),
+]
+
+
+# Fixtures
+
+
+@pytest.fixture(scope="session")
+def rng():
+    return np.random.default_rng(42)
+
+
+@pytest.fixture(scope="session")
+def groups(rng):
+    group1 = pd.Series(rng.normal(10, 2, 30), name="Control")
+    group2 = pd.Series(rng.normal(12, 2, 30), name="Treatment")
+    return group1, group2
+
+
+@pytest.fixture(scope="session")
+def categories():
+    return pd.Series(["A", "B", "A", "C", "B", "A"] * 10, name="Category")
 
 
-def run_test_suite():
-    """Run comprehensive test suite for ResearchPy."""
+@pytest.fixture(scope="session")
+def corr_data(rng):
+    return pd.DataFrame(
+        {
+            "x": rng.normal(0, 1, 50),
+            "y": rng.normal(0, 1, 50),
+            "z": rng.normal(0, 1, 50),
+        }
+    )
 
-    print("=" * 60)
-    print("ResearchPy Comprehensive Test Suite")
-    print("=" * 60)
 
-    # Import ResearchPy
-    try:
-        import researchpy as rp
+@pytest.fixture(scope="session")
+def crosstab_vars():
+    var1 = pd.Series(["A", "B", "A", "B"] * 25)
+    var2 = pd.Series(["X", "Y", "X", "Y"] * 25)
+    return var1, var2
 
-        print(f"✓ ResearchPy imported successfully (version {rp.__version__})")
-    except ImportError as e:
-        print(f"✗ Failed to import ResearchPy: {e}")
-        return False
 
-    # Set random seed for reproducibility
-    np.random.seed(42)
+@pytest.fixture(scope="session")
+def model_data(rng):
+    return pd.DataFrame(
+        {
+            "dependent": rng.normal(0, 1, 100),
+            "independent": rng.normal(0, 1, 100),
+        }
+    )
 
-    # Test results storage
-    test_results = []
 
-    # Test 1: Basic T-Test
-    print("\n1. Testing T-Test Functions")
-    try:
-        group1 = pd.Series(np.random.normal(10, 2, 30), name="Control")
-        group2 = pd.Series(np.random.normal(12, 2, 30), name="Treatment")
+# 1. T-Test Functions
 
-        # Independent t-test
-        desc, results = rp.ttest(group1, group2)
-        assert isinstance(desc, pd.DataFrame), "Descriptives should be DataFrame"
-        assert isinstance(results, pd.DataFrame), "Results should be DataFrame"
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"paired": True}, {"equal_variances": False}],
+    ids=["independent", "paired", "welch"],
+)
+def test_ttest(groups, kwargs):
+    desc, results = rp.ttest(*groups, **kwargs)
+    assert isinstance(desc, pd.DataFrame), "Descriptives should be DataFrame"
+    assert isinstance(results, pd.DataFrame), "Results should be DataFrame"
+    if not kwargs:
         assert desc.shape[0] == 3, "Should have 3 rows in descriptives"
-        print("  ✓ Independent t-test works")
-
-        # Paired t-test
-        desc_paired, results_paired = rp.ttest(group1, group2, paired=True)
-        assert isinstance(
-            desc_paired, pd.DataFrame
-        ), "Paired descriptives should be DataFrame"
-        print("  ✓ Paired t-test works")
-
-        # Welch's t-test
-        desc_welch, results_welch = rp.ttest(group1, group2, equal_variances=False)
-        assert isinstance(
-            desc_welch, pd.DataFrame
-        ), "Welch descriptives should be DataFrame"
-        print("  ✓ Welch's t-test works")
-
-        test_results.append(("T-Test Functions", True, None))
-
-    except Exception as e:
-        print(f"  ✗ T-Test failed: {e}")
-        test_results.append(("T-Test Functions", False, str(e)))
-
-    # Test 2: Summary Statistics
-    print("\n2. Testing Summary Statistics")
-    try:
-        # Continuous summary
-        summary_cont = rp.summary_cont(group1)
-        assert isinstance(summary_cont, pd.DataFrame), "Summary should be DataFrame"
-        print("  ✓ Continuous summary works")
-
-        # Categorical summary
-        categories = pd.Series(["A", "B", "A", "C", "B", "A"] * 10, name="Category")
-        try:
-            summary_cat = rp.summary_cat(categories)
-            assert isinstance(
-                summary_cat, pd.DataFrame
-            ), "Categorical summary should be DataFrame"
-            print("  ✓ Categorical summary works")
-        except Exception as cat_error:
-            print(f"  ! Categorical summary failed: {cat_error}")
-
-        # Codebook (function prints output but may return None)
-        test_data = pd.DataFrame(
-            {"numeric": np.random.normal(0, 1, 60), "categorical": categories}
-        )
-        try:
-            codebook = rp.codebook(test_data)
-            # Codebook prints output, return value may be None
-            print("  ✓ Codebook works")
-        except Exception as cb_error:
-            print(f"  ! Codebook failed: {cb_error}")
-
-        test_results.append(("Summary Statistics", True, None))
-
-    except Exception as e:
-        print(f"  ✗ Summary Statistics failed: {e}")
-        test_results.append(("Summary Statistics", False, str(e)))
-
-    # Test 3: Correlation Analysis
-    print("\n3. Testing Correlation Analysis")
-    try:
-        corr_data = pd.DataFrame(
-            {
-                "x": np.random.normal(0, 1, 50),
-                "y": np.random.normal(0, 1, 50),
-                "z": np.random.normal(0, 1, 50),
-            }
-        )
-
-        # Case-wise correlation
-        info, corr_matrix, p_values = rp.corr_case(corr_data)
-        assert isinstance(
-            corr_matrix, pd.DataFrame
-        ), "Correlation matrix should be DataFrame"
-        assert isinstance(p_values, pd.DataFrame), "P-values should be DataFrame"
-        print("  ✓ Case-wise correlation works")
-
-        # Pairwise correlation
-        pairwise_corr = rp.corr_pair(corr_data)
-        assert isinstance(
-            pairwise_corr, pd.DataFrame
-        ), "Pairwise correlation should be DataFrame"
-        print("  ✓ Pairwise correlation works")
-
-        test_results.append(("Correlation Analysis", True, None))
-
-    except Exception as e:
-        print(f"  ✗ Correlation Analysis failed: {e}")
-        test_results.append(("Correlation Analysis", False, str(e)))
-
-    # Test 4: Crosstabulation
-    print("\n4. Testing Crosstabulation")
-    try:
-        var1 = pd.Series(["A", "B", "A", "B"] * 25)
-        var2 = pd.Series(["X", "Y", "X", "Y"] * 25)
-
-        # Basic crosstab
-        crosstab_result = rp.crosstab(var1, var2)
-        assert isinstance(crosstab_result, pd.DataFrame), "Crosstab should be DataFrame"
-        print("  ✓ Basic crosstabulation works")
-
-        # Crosstab with test
-        try:
-            crosstab_test, chi2_results = rp.crosstab(var1, var2, test="chi-square")
-            print("  ✓ Crosstabulation with chi-square test works")
-        except:
-            print("  ! Chi-square test not available or failed")
-
-        test_results.append(("Crosstabulation", True, None))
-
-    except Exception as e:
-        print(f"  ✗ Crosstabulation failed: {e}")
-        test_results.append(("Crosstabulation", False, str(e)))
-
-    # Test 5: Basic Statistics Functions
-    print("\n5. Testing Basic Statistics Functions")
-    try:
-        test_array = np.array([1, 2, np.nan, 4, 5])
-
-        # Count function
-        count_result = rp.count(test_array)
-        assert count_result == 4, f"Count should be 4, got {count_result}"
-        print("  ✓ Count function works")
-
-        # Other basic stats
-        var_result = rp.nanvar(test_array)
-        std_result = rp.nanstd(test_array)
-        assert not np.isnan(var_result), "Variance should not be NaN"
-        assert not np.isnan(std_result), "Standard deviation should not be NaN"
-        print("  ✓ Basic statistics functions work")
-
-        test_results.append(("Basic Statistics", True, None))
-
-    except Exception as e:
-        print(f"  ✗ Basic Statistics failed: {e}")
-        test_results.append(("Basic Statistics", False, str(e)))
-
-    # Test 6: Advanced Features
-    print("\n6. Testing Advanced Features")
-    try:
-        # Test classes exist and can be instantiated
-        test_df = pd.DataFrame(
-            {
-                "dependent": np.random.normal(0, 1, 100),
-                "independent": np.random.normal(0, 1, 100),
-            }
-        )
-
-        # Test difference_test class
-        try:
-            diff_test = rp.difference_test("dependent ~ independent", data=test_df)
-            assert hasattr(
-                diff_test, "conduct"
-            ), "difference_test should have conduct method"
-            print("  ✓ difference_test class works")
-        except Exception as diff_error:
-            print(f"  ! difference_test failed: {diff_error}")
-
-        # Test model classes exist
-        assert hasattr(rp, "model"), "Should have model class"
-        assert hasattr(rp, "ols"), "Should have ols class"
-        assert hasattr(rp, "anova"), "Should have anova class"
-        print("  ✓ Advanced model classes available")
-
-        test_results.append(("Advanced Features", True, None))
-
-    except Exception as e:
-        print(f"  ✗ Advanced Features failed: {e}")
-        test_results.append(("Advanced Features", False, str(e)))
-
-    # Test 7: Import Structure
-    print("\n7. Testing Import Structure")
-    try:
-        # Test that all expected functions are available
-        expected_functions = [
-            "ttest",
-            "summary_cont",
-            "summary_cat",
-            "codebook",
-            "corr_case",
-            "corr_pair",
-            "crosstab",
-            "count",
-        ]
-
-        for func_name in expected_functions:
-            assert hasattr(rp, func_name), f"Missing function: {func_name}"
-
-        # Test metadata
-        assert hasattr(rp, "__version__"), "Should have version"
-        assert hasattr(rp, "__author__"), "Should have author"
-        print("  ✓ All expected functions and metadata available")
-
-        test_results.append(("Import Structure", True, None))
-
-    except Exception as e:
-        print(f"  ✗ Import Structure failed: {e}")
-        test_results.append(("Import Structure", False, str(e)))
-
-    # Test 8: Edge Cases and Error Handling
-    print("\n8. Testing Edge Cases")
-    try:
-        # Test with missing data
-        data_with_nans = pd.Series([1, 2, np.nan, 4, np.nan])
-        summary_with_nans = rp.summary_cont(data_with_nans)
-        assert isinstance(summary_with_nans, pd.DataFrame), "Should handle NaN data"
-        print("  ✓ Handles missing data correctly")
-
-        # Test small samples
-        small_group1 = pd.Series([1, 2, 3])
-        small_group2 = pd.Series([4, 5, 6])
-        small_desc, small_results = rp.ttest(small_group1, small_group2)
-        assert isinstance(small_desc, pd.DataFrame), "Should handle small samples"
-        print("  ✓ Handles small samples correctly")
-
-        test_results.append(("Edge Cases", True, None))
-
-    except Exception as e:
-        print(f"  ✗ Edge Cases failed: {e}")
-        test_results.append(("Edge Cases", False, str(e)))
-
-    # Test 9: Visualization Functions
-    print("\n9. Testing Visualization Functions")
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-        from researchpy.visualization import (
-            plot_ttest,
-            plot_correlation,
-            plot_anova,
-            plot_crosstab,
-        )
-
-        plot_ttest(group1, group2)
-        plot_correlation(corr_data)
-        plot_anova("dependent ~ independent", test_df)
-        plot_crosstab(var1, var2)
-        plt.close("all")
-
-        test_results.append(("Visualization Functions", True, None))
-    except Exception as e:
-        print(f"  ✗ Visualization Functions failed: {e}")
-        test_results.append(("Visualization Functions", False, str(e)))
-
-    # Summary Report
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY REPORT")
-    print("=" * 60)
-
-    passed = sum(1 for _, success, _ in test_results if success)
-    total = len(test_results)
-
-    for test_name, success, error in test_results:
-        status = "PASS" if success else "FAIL"
-        print(f"{test_name:<25} {status}")
-        if error:
-            print(f"  Error: {error}")
-
-    print(f"\nResults: {passed}/{total} tests passed")
-
-    if passed == total:
-        print("🎉 All tests passed! ResearchPy is working correctly.")
-        return True
-    else:
-        print(f"⚠️  {total - passed} tests failed. See details above.")
-        return False
+
+
+# 2. Summary Statistics
+
+
+def test_summary_cont(groups):
+    summary_cont = rp.summary_cont(groups[0])
+    assert isinstance(summary_cont, pd.DataFrame), "Summary should be DataFrame"
+
+
+def test_summary_cont_groupby():
+    rng = np.random.default_rng(3)
+    data = pd.DataFrame(
+        {
+            "key": ["a"] * 12 + ["b"] * 9 + ["c"],
+            "x": rng.normal(0, 1, 22),
+            "y": rng.normal(5, 2, 22),
+        }
+    )
+    data.loc[[3, 15], "x"] = np.nan
+    table = rp.summary_cont(data.groupby("key")[["x", "y"]])
+
+    for variable in ["x", "y"]:
+        for key, group in data.groupby("key"):
+            expected = rp.summary_cont(group[variable])
+            np.testing.assert_allclose(
+                table.loc[key, variable].to_numpy(dtype=float),
+                expected.iloc[0, 1:].to_numpy(dtype=float),
+            )
+
+
+def test_summarize_dataframe(corr_data):
+    data = corr_data.copy()
+    data.iloc[::7, 0] = np.nan
+    stats = ["N", "Mean", "Median", "Variance", "SD", "SE", "CI",
+             "Min", "Max", "Range", "Kurtosis", "Skew"]
+    result = rp.summarize(data, stats=stats)
+
+    assert result["Name"].tolist() == data.columns.tolist()
+    assert result["N"].tolist() == data.count().tolist()
+    sd = np.nanstd(data, axis=0, ddof=1)
+    for column, expected in [("Variance", sd**2), ("SD", sd),
+                             ("SE", sd / np.sqrt(data.count()))]:
+        np.testing.assert_allclose(result[column].astype(float), expected, atol=1e-4)
+
+    for ci, (_, values) in zip(result["95% Conf. Interval"], data.items()):
+        assert isinstance(ci, list), "CI should be a [lower, upper] list"
+        assert ci == rp.confidence_interval(values)
+
+
+def test_summary_cat(categories):
+    summary_cat = rp.summary_cat(categories)
+    assert isinstance(
+        summary_cat, pd.DataFrame
+    ), "Categorical summary should be DataFrame"
+
+
+def test_codebook(rng, categories):
+    test_data = pd.DataFrame(
+        {"numeric": rng.normal(0, 1, 60), "categorical": categories}
+    )
+    # Codebook prints output, return value may be None
+    rp.codebook(test_data)
+
+
+# 3. Correlation Analysis
+
+
+def test_corr_case(corr_data):
+    info, corr_matrix, p_values = rp.corr_case(corr_data)
+    assert isinstance(
+        corr_matrix, pd.DataFrame
+    ), "Correlation matrix should be DataFrame"
+    assert isinstance(p_values, pd.DataFrame), "P-values should be DataFrame"
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        None,
+        {"a": [1.0, 2.0], "b": [3.0, 1.0]},
+        {"a": [1.0, 2.0, 3.0], "b": [2.0, 2.0, 2.0], "c": [1.0, 3.0, 2.0]},
+    ],
+    ids=["random", "two_observations", "constant_column"],
+)
+def test_pearson_matrix_matches_pearsonr(corr_data, columns):
+    from researchpy.correlation import _pearson_matrix
+
+    data = corr_data if columns is None else pd.DataFrame(columns)
+    r_matrix, p_matrix = _pearson_matrix(data)
+
+    for a in data.columns:
+        for b in data.columns:
+            expected = scipy.stats.pearsonr(data[a], data[b])
+            np.testing.assert_allclose(
+                [r_matrix.loc[a, b], p_matrix.loc[a, b]],
+                [expected.statistic, expected.pvalue],
+                atol=1e-6,
+            )
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman", "kendall"])
+def test_corr_r_matches_corr_case(corr_data, method):
+    from researchpy.correlation import _corr_r
+
+    _, r_vals, _ = rp.corr_case(corr_data, method=method)
+    pd.testing.assert_frame_equal(_corr_r(corr_data, method=method), r_vals)
+
+
+def test_corr_pair(corr_data):
+    pairwise_corr = rp.corr_pair(corr_data)
+    assert isinstance(
+        pairwise_corr, pd.DataFrame
+    ), "Pairwise correlation should be DataFrame"
+
+
+# 4. Crosstabulation
+
+
+def test_crosstab(crosstab_vars):
+    crosstab_result = rp.crosstab(*crosstab_vars)
+    assert isinstance(crosstab_result, pd.DataFrame), "Crosstab should be DataFrame"
+
+
+def test_crosstab_chi_square(crosstab_vars):
+    crosstab_test, chi2_results = rp.crosstab(*crosstab_vars, test="chi-square")
+    assert isinstance(crosstab_test, pd.DataFrame)
+    assert isinstance(chi2_results, pd.DataFrame)
+
+
+# 5. Basic Statistics Functions
+
+
+def test_basic_stats():
+    test_array = np.array([1, 2, np.nan, 4, 5])
+
+    count_result = rp.count(test_array)
+    assert count_result == 4, f"Count should be 4, got {count_result}"
+
+    var_result = rp.nanvar(test_array)
+    std_result = rp.nanstd(test_array)
+    assert not np.isnan(var_result), "Variance should not be NaN"
+    assert not np.isnan(std_result), "Standard deviation should not be NaN"
+
+    # Integer, unsigned and boolean data cannot hold NaN
+    for dtype in (np.int64, np.uint8, bool):
+        values = np.array([1, 0, 1, 1, 0], dtype=dtype)
+        assert rp.count(values) == 5, f"Count of {values.dtype} data should be 5"
+        assert rp.nanvar(values) == pytest.approx(np.var(values, ddof=1))
+
+    # A 2-D array counts every element, not its number of rows
+    matrix = np.arange(12).reshape(4, 3)
+    assert rp.count(matrix) == 12, "Count should include every element"
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1.0, 2.0, np.nan, 4.0, 9.0, 3.0],
+        [5.0] * 6,
+        # Spread of a few ulp, below scipy's near-zero-variance cut-off
+        list(1e8 + np.spacing(1e8) * np.array([0, 0, 0, 0, 0, 0, 0, 6, 6, 1])),
+        [7.0],
+        [np.nan] * 3,
+    ],
+    ids=["missing", "constant", "near_constant", "single", "all_missing"],
+)
+def test_skew_kurtosis_match_scipy(values):
+    from researchpy.basic_stats import _moments
+
+    data = np.array(values)
+    expected_skew = scipy.stats.skew(data, nan_policy="omit")
+    expected_kurtosis = scipy.stats.kurtosis(data, fisher=False, nan_policy="omit")
+
+    # Both the data itself and a precomputed _Moments are accepted
+    for d in (data, _moments(data)):
+        np.testing.assert_allclose(rp.skew(d), expected_skew)
+        np.testing.assert_allclose(rp.kurtosis(d), expected_kurtosis)
+
+
+@pytest.fixture
+def jit_kernels(monkeypatch):
+    pytest.importorskip("numba")
+    from researchpy import basic_stats
+
+    # Send arrays of every length to the numba kernels
+    monkeypatch.setattr(basic_stats, "_JIT_MIN_SIZE", 0)
+
+
+def test_jit_moments_accuracy(jit_kernels):
+    from fractions import Fraction
+
+    # A large mean and small spread exposes cancellation in the moment sums
+    data = np.random.default_rng(1).normal(1e8, 3, 2001)
+    data[::11] = np.nan
+
+    values = [Fraction(x) for x in data if not np.isnan(x)]
+    n = len(values)
+    mean = sum(values) / n
+    m2, m3, m4 = (float(sum((x - mean) ** k for x in values)) for k in (2, 3, 4))
+
+    assert rp.nanvar(data) == pytest.approx(m2 / (n - 1), rel=1e-12)
+    assert rp.skew(data) == pytest.approx(np.sqrt(n) * m3 / m2**1.5, rel=1e-9)
+    assert rp.kurtosis(data) == pytest.approx(n * m4 / m2**2, rel=1e-12)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("path", ["numba", "numpy"])
+@pytest.mark.parametrize(
+    "case", ["missing", "all_missing", "empty", "infinite", "non_contiguous"]
+)
+def test_kernels_match_numpy(request, path, case):
+    if path == "numba":
+        request.getfixturevalue("jit_kernels")
+
+    data = np.random.default_rng(2).normal(5, 2, 1001)
+    data[::9] = np.nan
+    data = {
+        "missing": data,
+        "all_missing": np.full(5, np.nan),
+        "empty": np.array([]),
+        "infinite": np.array([1.0, np.inf, 2.0, np.nan, -3.0]),
+        "non_contiguous": data[::3],
+    }[case]
+    valid = data[~np.isnan(data)]
+
+    expected = [
+        np.count_nonzero(~np.isnan(data)),
+        np.nanvar(data, ddof=1),
+        scipy.stats.sem(data, nan_policy="omit"),
+        np.max(valid) - np.min(valid) if valid.size else np.nan,
+        scipy.stats.skew(data, nan_policy="omit"),
+        scipy.stats.kurtosis(data, fisher=False, nan_policy="omit"),
+    ]
+    result = [rp.count(data), rp.nanvar(data), rp.nansem(data),
+              rp.value_range(data), rp.skew(data), rp.kurtosis(data)]
+
+    np.testing.assert_allclose(result, expected, rtol=1e-10)
+
+
+def test_confidence_interval_forms_agree(corr_data):
+    column = corr_data["x"]
+    expected = rp.confidence_interval(column, decimals=10)
+
+    lower, upper = rp.confidence_interval_batch(corr_data.to_numpy())
+    assert [round(lower[0], 10), round(upper[0], 10)] == expected
+
+    ci = rp.make_ci_fn(0.95, rp.count(column) - 1)
+    bounds = ci(column.mean(), rp.nansem(column))
+    assert [round(bound, 10) for bound in bounds] == expected
+
+
+# 6. Advanced Features
+
+
+@pytest.mark.xfail(reason="difference_test does not support a continuous independent variable")
+def test_difference_test(model_data):
+    diff_test = rp.difference_test("dependent ~ independent", data=model_data)
+    assert hasattr(diff_test, "conduct"), "difference_test should have conduct method"
+
+
+@pytest.mark.parametrize("name", ["model", "ols", "anova"])
+def test_model_classes_available(name):
+    assert hasattr(rp, name), f"Should have {name} class"
+
+
+# 7. Import Structure
+
+
+@pytest.mark.parametrize(
+    "func_name",
+    [
+        "ttest",
+        "summary_cont",
+        "summary_cat",
+        "codebook",
+        "corr_case",
+        "corr_pair",
+        "crosstab",
+        "count",
+    ],
+)
+def test_expected_functions(func_name):
+    assert hasattr(rp, func_name), f"Missing function: {func_name}"
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, researchpy; "
+        "print([m for m in ('scipy', 'matplotlib') if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    assert result.stdout.strip() == "[]", "Importing researchpy should not load scipy or matplotlib"
+
+
+def test_submodule_imports_keep_public_names():
+    importlib.import_module("researchpy.visualization")
+    importlib.import_module("researchpy.ttest")
+    assert inspect.isfunction(rp.ttest), "rp.ttest should be the function, not the module"
+    assert inspect.isclass(rp.anova), "rp.anova should be the class, not the module"
+    assert inspect.isfunction(rp.predict), "rp.predict should be the function, not the module"
+
+
+def test_public_submodules_are_accessible():
+    code = (
+        "import inspect, researchpy as rp; "
+        "print(all(inspect.ismodule(getattr(rp, name)) for name in "
+        "('basic_stats', 'summary', 'correlation', 'utility', 'visualization')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    assert result.stdout.strip() == "True", "Submodules should be accessible on a fresh import"
+
+
+def test_metadata():
+    assert hasattr(rp, "__version__"), "Should have version"
+    assert hasattr(rp, "__author__"), "Should have author"
+
+
+# 8. Edge Cases and Error Handling
+
+
+def test_missing_data():
+    data_with_nans = pd.Series([1, 2, np.nan, 4, np.nan])
+    summary_with_nans = rp.summary_cont(data_with_nans)
+    assert isinstance(summary_with_nans, pd.DataFrame), "Should handle NaN data"
+
+
+def test_small_samples():
+    small_group1 = pd.Series([1, 2, 3])
+    small_group2 = pd.Series([4, 5, 6])
+    small_desc, small_results = rp.ttest(small_group1, small_group2)
+    assert isinstance(small_desc, pd.DataFrame), "Should handle small samples"
+
+
+# 9. Visualization Functions
+
+
+@pytest.fixture
+def pyplot():
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    yield plt
+    plt.close("all")
+
+
+def test_visualization(pyplot, groups, corr_data, model_data, crosstab_vars):
+    from researchpy.visualization import (
+        plot_ttest,
+        plot_correlation,
+        plot_anova,
+        plot_crosstab,
+    )
+
+    plot_ttest(*groups)
+    plot_correlation(corr_data)
+    plot_anova("dependent ~ independent", model_data)
+    plot_crosstab(*crosstab_vars)
+
+
+def test_plot_ttest_show_stats(pyplot, groups):
+    from researchpy.visualization import plot_ttest
+
+    ax = plot_ttest(*groups)
+    assert not hasattr(ax, "_rp_desc") and not hasattr(ax, "_rp_results")
+
+    ax = plot_ttest(*groups, show_stats=True)
+    assert isinstance(ax._rp_desc, pd.DataFrame), "Descriptives should be attached"
+    assert isinstance(ax._rp_results, pd.DataFrame), "Results should be attached"
 
 
 if __name__ == "__main__":
-    success = run_test_suite()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__]))